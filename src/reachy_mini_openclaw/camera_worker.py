@@ -10,22 +10,54 @@ Provides:
 Based on pollen-robotics/reachy_mini_conversation_app camera worker.
 """
 
+import math
 import time
 import logging
 import threading
-from typing import Any, List, Tuple, Optional
+from typing import Any, Dict, Tuple, Optional
 
 import numpy as np
 from numpy.typing import NDArray
-from scipy.spatial.transform import Rotation as R
 
 from reachy_mini import ReachyMini
-from reachy_mini.utils.interpolation import linear_pose_interpolation
+
+try:
+    import cv2
+except ImportError:  # opencv ships with the vision extras only
+    cv2 = None
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the helpers then run as plain Python
+    def njit(*args: Any, **kwargs: Any) -> Any:
+        def decorator(func: Any) -> Any:
+            return func
+        return decorator
 
 
 logger = logging.getLogger(__name__)
 
 
+@njit(cache=True, fastmath=True)
+def _mat_to_euler_xyz(m: NDArray[np.floating]) -> Tuple[float, float, float]:
+    """Extract extrinsic 'xyz' Euler angles from a rotation matrix.
+    
+    Closed-form equivalent of ``R.from_matrix(m).as_euler("xyz")`` for the
+    single-matrix case, without SciPy's quaternion round-trip
+    (m = Rz(yaw) @ Ry(pitch) @ Rx(roll)).
+    
+    Args:
+        m: 3x3 rotation matrix
+        
+    Returns:
+        Tuple of (roll, pitch, yaw) in radians
+    """
+    roll = math.atan2(m[2, 1], m[2, 2])
+    pitch = math.asin(min(1.0, max(-1.0, -m[2, 0])))
+    yaw = math.atan2(m[1, 0], m[0, 0])
+    return roll, pitch, yaw
+
+
 class CameraWorker:
     """Thread-safe camera worker with frame buffering and face tracking.
     
@@ -46,23 +78,30 @@ class CameraWorker:
         self.reachy_mini = reachy_mini
         self.head_tracker = head_tracker
 
-        # Thread-safe frame storage
-        self.latest_frame: Optional[NDArray[np.uint8]] = None
-        self.frame_lock = threading.Lock()
+        # Latest camera frame, published by reference and read-only. get_frame()
+        # returns a fresh ndarray per call, so a published frame is never
+        # written again and readers can share it without copying or locking.
+        self._latest_frame: Optional[NDArray[np.uint8]] = None
         self._stop_event = threading.Event()
         self._thread: Optional[threading.Thread] = None
 
+        # Face tracking runs on its own thread so inference never stalls frame
+        # capture; the capture loop signals each newly published frame.
+        self._frame_event = threading.Event()
+        self._tracker_thread: Optional[threading.Thread] = None
+
         # Face tracking state
         self.is_head_tracking_enabled = True
-        self.face_tracking_offsets: List[float] = [
+        # Published as an immutable tuple: writers swap the whole attribute in
+        # one assignment (atomic under the GIL), so readers need no lock.
+        self.face_tracking_offsets: Tuple[float, float, float, float, float, float] = (
             0.0, 0.0, 0.0, 0.0, 0.0, 0.0,
-        ]  # x, y, z, roll, pitch, yaw
-        self.face_tracking_lock = threading.Lock()
+        )  # x, y, z, roll, pitch, yaw
 
         # Face tracking timing (for smooth interpolation back to neutral)
         self.last_face_detected_time: Optional[float] = None
         self.interpolation_start_time: Optional[float] = None
-        self.interpolation_start_pose: Optional[NDArray[np.float32]] = None
+        self._interp_start_offsets: Optional[NDArray[np.float64]] = None
         self.face_lost_delay = 2.0  # seconds to wait before starting interpolation
         self.interpolation_duration = 1.0  # seconds to interpolate back to neutral
 
@@ -73,14 +112,32 @@ class CameraWorker:
         # 0.85 provides accurate convergence via closed-loop feedback while
         # avoiding single-frame overshoot that causes jitter.
         self.tracking_scale = 0.85
+
+        # Frames are downscaled by this factor before face detection. The
+        # tracker returns normalized coordinates, so nothing else changes.
+        self.detection_scale = 0.5
+
+        # Cameras can re-deliver an unchanged buffer; a hash of a sparse pixel
+        # grid lets us reuse the previous detection instead of re-running it.
+        self._last_frame_hash: Optional[int] = None
+        self._last_eye_center: Optional[NDArray[np.float32]] = None
+
+        # Adaptive detection duty cycle: after a run of empty frames, only run
+        # the detector on every k-th frame (k grows up to _max_detect_every)
+        self._no_face_count = 0
+        self._detect_every = 1
+        self._max_detect_every = 5
         
         # Smoothing factor for exponential moving average (0.0-1.0)
         # At 25Hz with alpha=0.25, 95% convergence ~0.5s -- smooth enough to
         # filter detection noise, responsive enough to feel like eye contact.
         self.smoothing_alpha = 0.25
         
-        # Previous smoothed offsets for EMA calculation
-        self._smoothed_offsets: List[float] = [0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
+        # Previous smoothed offsets for EMA calculation, plus a scratch buffer
+        # for the newest raw offsets (both preallocated to keep the hot path
+        # allocation-free)
+        self._smoothed_offsets: NDArray[np.float64] = np.zeros(6, dtype=np.float64)
+        self._new_offsets_buf: NDArray[np.float64] = np.empty(6, dtype=np.float64)
         
         # --- Room scanning state ---
         # When no face is visible, the robot periodically sweeps the room.
@@ -90,31 +147,51 @@ class CameraWorker:
         self._scan_yaw_amplitude = np.deg2rad(35)  # ±35 degrees
         self._scan_period = 8.0  # seconds for a full left-right-left cycle
         self._scan_pitch_offset = np.deg2rad(3)  # slight upward tilt while scanning
+        self._scan_omega = 2.0 * np.pi / self._scan_period
         # Start scanning immediately at boot (before any face has ever been seen)
         self._ever_seen_face = False
 
+        # --- Profiling counters ---
+        # EMA of per-stage durations in nanoseconds, plus detection hit rate and
+        # capture loop period. Logged every _stats_log_every frames and on stop().
+        self._stats_alpha = 0.1
+        self._stats_log_every = 250  # ~10s at 25Hz
+        self._stage_times: Dict[str, float] = {"grab": 0.0, "detect": 0.0, "math": 0.0, "sleep": 0.0}
+        self._loop_period_ema = 0.0
+        self._frames_total = 0
+        self._frames_with_face = 0
+
     def get_latest_frame(self) -> Optional[NDArray[np.uint8]]:
-        """Get the latest frame (thread-safe).
+        """Get the latest frame (thread-safe, zero-copy).
+        
+        The returned array is read-only and never modified afterwards, so it
+        can be held for as long as needed. Callers that want to draw on it
+        should take their own copy.
         
         Returns:
-            Copy of latest frame in BGR format, or None if no frame available
+            Latest frame in BGR format, or None if no frame available
         """
-        with self.frame_lock:
-            if self.latest_frame is None:
-                return None
-            return self.latest_frame.copy()
+        return self._latest_frame
+
+    def _publish_frame(self, frame: NDArray[np.uint8]) -> None:
+        """Make a freshly captured frame the latest one.
+        
+        Args:
+            frame: Frame returned by the camera (a new array on every call)
+        """
+        frame.flags.writeable = False
+        # A single attribute store, atomic under the GIL
+        self._latest_frame = frame
 
     def get_face_tracking_offsets(
         self,
     ) -> Tuple[float, float, float, float, float, float]:
-        """Get current face tracking offsets (thread-safe).
+        """Get current face tracking offsets (thread-safe, lock-free).
         
         Returns:
             Tuple of (x, y, z, roll, pitch, yaw) offsets
         """
-        with self.face_tracking_lock:
-            offsets = self.face_tracking_offsets
-            return (offsets[0], offsets[1], offsets[2], offsets[3], offsets[4], offsets[5])
+        return self.face_tracking_offsets
 
     def set_head_tracking_enabled(self, enabled: bool) -> None:
         """Enable/disable head tracking.
@@ -124,26 +201,60 @@ class CameraWorker:
         """
         if enabled and not self.is_head_tracking_enabled:
             # Reset smoothed offsets so tracking converges quickly from scratch
-            self._smoothed_offsets = [0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
+            self._smoothed_offsets.fill(0.0)
             # Start scanning immediately when re-enabled
             self._start_scanning()
         self.is_head_tracking_enabled = enabled
         logger.info("Head tracking %s", "enabled" if enabled else "disabled")
 
     def start(self) -> None:
-        """Start the camera worker loop in a thread."""
+        """Start the camera capture and face tracking loops in threads."""
         self._stop_event.clear()
+        self._frame_event.clear()
         self._thread = threading.Thread(target=self._working_loop, daemon=True)
         self._thread.start()
+        self._tracker_thread = threading.Thread(target=self._tracking_loop, daemon=True)
+        self._tracker_thread.start()
         logger.info("Camera worker started")
 
     def stop(self) -> None:
-        """Stop the camera worker loop."""
+        """Stop the camera capture and face tracking loops."""
         self._stop_event.set()
+        self._frame_event.set()  # wake the tracker so it sees the stop flag
         if self._thread is not None:
             self._thread.join(timeout=2.0)
+        if self._tracker_thread is not None:
+            self._tracker_thread.join(timeout=2.0)
+        self._log_stats(logging.INFO)
         logger.info("Camera worker stopped")
 
+    # ------------------------------------------------------------------
+    # Profiling helpers
+    # ------------------------------------------------------------------
+
+    def _record_stage(self, stage: str, elapsed_ns: int) -> None:
+        """Fold a stage duration (nanoseconds) into its moving average."""
+        times = self._stage_times
+        times[stage] += self._stats_alpha * (elapsed_ns - times[stage])
+
+    def _log_stats(self, level: int = logging.DEBUG) -> None:
+        """Log per-stage timings, loop rate and detection hit rate."""
+        times = self._stage_times
+        period_ms = self._loop_period_ema / 1e6
+        hit_rate = self._frames_with_face / self._frames_total if self._frames_total else 0.0
+        logger.log(
+            level,
+            "Camera stats: %.1f Hz, grab %.2f ms, detect %.2f ms, math %.2f ms, "
+            "sleep %.2f ms, face in %.0f%% of %d frames",
+            1e3 / period_ms if period_ms else 0.0,
+            times["grab"] / 1e6,
+            times["detect"] / 1e6,
+            times["math"] / 1e6,
+            times["sleep"] / 1e6,
+            hit_rate * 100.0,
+            self._frames_total,
+        )
+
     # ------------------------------------------------------------------
     # Scanning helpers
     # ------------------------------------------------------------------
@@ -152,7 +263,7 @@ class CameraWorker:
         """Begin the room-scanning sweep."""
         if not self._scanning:
             self._scanning = True
-            self._scanning_start_time = time.time()
+            self._scanning_start_time = time.monotonic()
             logger.debug("Started room scanning")
 
     def _stop_scanning(self) -> None:
@@ -169,49 +280,112 @@ class CameraWorker:
         """
         t = current_time - self._scanning_start_time
         
-        yaw = float(self._scan_yaw_amplitude * np.sin(2 * np.pi * t / self._scan_period))
+        yaw = float(self._scan_yaw_amplitude * math.sin(self._scan_omega * t))
         pitch = float(self._scan_pitch_offset)
         
-        with self.face_tracking_lock:
-            self.face_tracking_offsets = [0.0, 0.0, 0.0, 0.0, pitch, yaw]
+        self.face_tracking_offsets = (0.0, 0.0, 0.0, 0.0, pitch, yaw)
 
     # ------------------------------------------------------------------
     # Main loop
     # ------------------------------------------------------------------
 
     def _working_loop(self) -> None:
-        """Main camera worker loop.
+        """Main camera capture loop.
         
-        Runs at ~25Hz, captures frames and processes face tracking.
+        Runs at ~25Hz, captures frames and publishes them for consumers and
+        the face tracking thread.
         """
         logger.debug("Starting camera working loop")
 
-        # Neutral pose for interpolation target
-        neutral_pose = np.eye(4, dtype=np.float32)
+        # Bind hot-path callables once instead of resolving them every frame
+        get_frame = self.reachy_mini.media.get_frame
+        publish_frame = self._publish_frame
+        notify_frame = self._frame_event.set
+        stop_is_set = self._stop_event.is_set
+        monotonic = time.monotonic
+        sleep = time.sleep
+        perf_counter_ns = time.perf_counter_ns
+        record_stage = self._record_stage
+
+        period = 0.04
+        next_deadline = monotonic()
+        last_loop_start = 0
+
+        while not stop_is_set():
+            try:
+                loop_start = perf_counter_ns()
+                if last_loop_start:
+                    self._loop_period_ema += self._stats_alpha * (
+                        (loop_start - last_loop_start) - self._loop_period_ema
+                    )
+                last_loop_start = loop_start
+
+                # Get frame from robot
+                frame = get_frame()
+                record_stage("grab", perf_counter_ns() - loop_start)
+
+                if frame is not None:
+                    # Thread-safe frame storage
+                    publish_frame(frame)
+                    notify_frame()
+
+                # Sleep until the next deadline to hold ~25Hz without drift
+                next_deadline += period
+                delay = next_deadline - monotonic()
+                if delay > 0:
+                    sleep_start = perf_counter_ns()
+                    sleep(delay)
+                    record_stage("sleep", perf_counter_ns() - sleep_start)
+                elif delay < -0.1:
+                    # Fell far behind -- resync instead of bursting to catch up
+                    next_deadline = monotonic()
+
+            except Exception as e:
+                logger.error("Camera worker error: %s", e)
+                sleep(0.1)
+                next_deadline = monotonic()
+
+        logger.debug("Camera worker thread exited")
+
+    def _tracking_loop(self) -> None:
+        """Face tracking loop.
+        
+        Processes the latest published frame each time a new one arrives,
+        dropping any frames that were superseded while inference was running.
+        """
+        logger.debug("Starting face tracking loop")
+
         self.previous_head_tracking_state = self.is_head_tracking_enabled
         
         # Begin scanning right away so the robot looks for a face on startup
         if self.is_head_tracking_enabled and self.head_tracker is not None:
             self._start_scanning()
 
-        while not self._stop_event.is_set():
+        # Bind hot-path callables once instead of resolving them every frame
+        wait_for_frame = self._frame_event.wait
+        clear_frame = self._frame_event.clear
+        get_latest_frame = self.get_latest_frame
+        process_face_tracking = self._process_face_tracking
+        interpolate_to_neutral = self._interpolate_to_neutral
+        stop_is_set = self._stop_event.is_set
+        monotonic = time.monotonic
+
+        while not stop_is_set():
             try:
-                current_time = time.time()
+                if not wait_for_frame(timeout=0.1):
+                    continue
+                clear_frame()
 
-                # Get frame from robot
-                frame = self.reachy_mini.media.get_frame()
+                current_time = monotonic()
+                frame = get_latest_frame()
 
                 if frame is not None:
-                    # Thread-safe frame storage
-                    with self.frame_lock:
-                        self.latest_frame = frame
-
                     # Check if face tracking was just disabled
                     if self.previous_head_tracking_state and not self.is_head_tracking_enabled:
                         # Face tracking was just disabled - start interpolation to neutral
                         self.last_face_detected_time = current_time
                         self.interpolation_start_time = None
-                        self.interpolation_start_pose = None
+                        self._interp_start_offsets = None
                         self._stop_scanning()
 
                     # Update tracking state
@@ -219,36 +393,53 @@ class CameraWorker:
 
                     # Handle face tracking if enabled and head tracker available
                     if self.is_head_tracking_enabled and self.head_tracker is not None:
-                        self._process_face_tracking(frame, current_time, neutral_pose)
+                        process_face_tracking(frame, current_time)
                     elif self.last_face_detected_time is not None:
                         # Handle interpolation back to neutral when tracking disabled
-                        self._interpolate_to_neutral(current_time, neutral_pose)
-
-                # Sleep to maintain ~25Hz
-                time.sleep(0.04)
+                        interpolate_to_neutral(current_time)
 
             except Exception as e:
-                logger.error("Camera worker error: %s", e)
+                logger.error("Face tracking error: %s", e)
                 time.sleep(0.1)
 
-        logger.debug("Camera worker thread exited")
+        logger.debug("Face tracking thread exited")
 
-    def _process_face_tracking(
-        self, 
-        frame: NDArray[np.uint8], 
-        current_time: float,
-        neutral_pose: NDArray[np.float32]
-    ) -> None:
+    def _process_face_tracking(self, frame: NDArray[np.uint8], current_time: float) -> None:
         """Process face tracking from frame.
         
         Args:
             frame: Current camera frame
             current_time: Current timestamp
-            neutral_pose: Neutral pose matrix for interpolation
         """
-        eye_center, _ = self.head_tracker.get_head_position(frame)
+        detect_start = time.perf_counter_ns()
+        if self._detect_every > 1 and self._frames_total % self._detect_every != 0:
+            # Room has been empty for a while -- skip detection on this frame
+            eye_center = None
+        else:
+            frame_hash = hash(frame[::32, ::32].tobytes())
+            if frame_hash == self._last_frame_hash:
+                # Same image as last time -- the detection result cannot differ
+                eye_center = self._last_eye_center
+            else:
+                eye_center, _ = self.head_tracker.get_head_position(self._downscale_for_detection(frame))
+                self._last_frame_hash = frame_hash
+                self._last_eye_center = eye_center
+                if eye_center is None:
+                    self._no_face_count += 1
+                    self._detect_every = min(self._max_detect_every, 1 + self._no_face_count // 10)
+                else:
+                    self._no_face_count = 0
+                    self._detect_every = 1
+        math_start = time.perf_counter_ns()
+        self._record_stage("detect", math_start - detect_start)
+
+        self._frames_total += 1
+        if self._frames_total % self._stats_log_every == 0:
+            self._log_stats()
 
         if eye_center is not None:
+            self._frames_with_face += 1
+
             # Face detected!
             if not self._ever_seen_face:
                 self._ever_seen_face = True
@@ -258,8 +449,7 @@ class CameraWorker:
             if self._scanning:
                 self._stop_scanning()
                 # Seed the EMA from current scanning offsets for smooth transition
-                with self.face_tracking_lock:
-                    self._smoothed_offsets = list(self.face_tracking_offsets)
+                self._smoothed_offsets[:] = self.face_tracking_offsets
 
             self.last_face_detected_time = current_time
             self.interpolation_start_time = None  # Stop any interpolation
@@ -280,31 +470,25 @@ class CameraWorker:
                 perform_movement=False,
             )
 
-            # Extract translation and rotation from the target pose
-            translation = target_pose[:3, 3]
-            rotation = R.from_matrix(target_pose[:3, :3]).as_euler("xyz", degrees=False)
+            # Extract translation and rotation from the target pose straight
+            # into the 6-float offsets buffer (leaves target_pose untouched)
+            new_offsets = self._new_offsets_buf
+            new_offsets[:3] = target_pose[:3, 3]
+            new_offsets[3:] = _mat_to_euler_xyz(target_pose[:3, :3])
 
             # Scale for smoother closed-loop convergence
-            translation *= self.tracking_scale
-            rotation *= self.tracking_scale
+            new_offsets *= self.tracking_scale
 
             # Apply exponential moving average (EMA) smoothing to reduce jitter
             # new_smoothed = alpha * new_value + (1 - alpha) * old_smoothed
             alpha = self.smoothing_alpha
-            new_offsets = [
-                translation[0], translation[1], translation[2],
-                rotation[0], rotation[1], rotation[2],
-            ]
-            
-            smoothed = [
-                alpha * new_offsets[i] + (1 - alpha) * self._smoothed_offsets[i]
-                for i in range(6)
-            ]
-            self._smoothed_offsets = smoothed
+            self._smoothed_offsets *= 1.0 - alpha
+            self._smoothed_offsets += alpha * new_offsets
+            smoothed = tuple(self._smoothed_offsets.tolist())
 
-            # Thread-safe update of face tracking offsets
-            with self.face_tracking_lock:
-                self.face_tracking_offsets = smoothed
+            # Atomic publish of face tracking offsets
+            self.face_tracking_offsets = smoothed
+            self._record_stage("math", time.perf_counter_ns() - math_start)
 
         else:
             # No face detected
@@ -313,20 +497,35 @@ class CameraWorker:
                 self._update_scanning_offsets(current_time)
             else:
                 # Not scanning yet -- go through the wait/return/scan sequence
-                self._interpolate_to_neutral(current_time, neutral_pose)
+                self._interpolate_to_neutral(current_time)
 
-    def _interpolate_to_neutral(
-        self, 
-        current_time: float,
-        neutral_pose: NDArray[np.float32]
-    ) -> None:
+    def _downscale_for_detection(self, frame: NDArray[np.uint8]) -> NDArray[np.uint8]:
+        """Shrink a frame for the face detector, leaving the original untouched.
+        
+        The result stays BGR: trackers handle their own channel order (see
+        ``get_head_tracker``), so any RGB swap happens on the small image.
+        
+        Args:
+            frame: Full-resolution camera frame
+            
+        Returns:
+            Downscaled copy of the frame (or the frame itself if disabled)
+        """
+        scale = self.detection_scale
+        if scale >= 1.0:
+            return frame
+        if cv2 is not None:
+            return cv2.resize(frame, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        step = max(1, round(1.0 / scale))
+        return np.ascontiguousarray(frame[::step, ::step])
+
+    def _interpolate_to_neutral(self, current_time: float) -> None:
         """Interpolate face tracking offsets back to neutral when face is lost.
         
         Once interpolation completes, automatically starts room scanning.
         
         Args:
             current_time: Current timestamp
-            neutral_pose: Target neutral pose matrix
         """
         if self.last_face_detected_time is None:
             # Never seen a face -- go straight to scanning
@@ -339,44 +538,26 @@ class CameraWorker:
             # Start interpolation if not already started
             if self.interpolation_start_time is None:
                 self.interpolation_start_time = current_time
-                # Capture current pose as start of interpolation
-                with self.face_tracking_lock:
-                    current_translation = self.face_tracking_offsets[:3]
-                    current_rotation_euler = self.face_tracking_offsets[3:]
-                    # Convert to 4x4 pose matrix
-                    pose_matrix = np.eye(4, dtype=np.float32)
-                    pose_matrix[:3, 3] = current_translation
-                    pose_matrix[:3, :3] = R.from_euler(
-                        "xyz", current_rotation_euler
-                    ).as_matrix()
-                    self.interpolation_start_pose = pose_matrix
+                # Capture current offsets as start of interpolation
+                self._interp_start_offsets = np.array(
+                    self.face_tracking_offsets, dtype=np.float64
+                )
 
             # Calculate interpolation progress (t from 0 to 1)
             elapsed_interpolation = current_time - self.interpolation_start_time
             t = min(1.0, elapsed_interpolation / self.interpolation_duration)
 
-            # Interpolate between current pose and neutral pose
-            interpolated_pose = linear_pose_interpolation(
-                self.interpolation_start_pose,
-                neutral_pose,
-                t,
-            )
-
-            # Extract translation and rotation from interpolated pose
-            translation = interpolated_pose[:3, 3]
-            rotation = R.from_matrix(interpolated_pose[:3, :3]).as_euler("xyz", degrees=False)
+            # Neutral is all zeros, so lerping the offsets directly matches the
+            # pose-space interpolation for the small angles used here
+            interpolated = tuple(((1.0 - t) * self._interp_start_offsets).tolist())
 
-            # Thread-safe update of face tracking offsets
-            with self.face_tracking_lock:
-                self.face_tracking_offsets = [
-                    translation[0], translation[1], translation[2],
-                    rotation[0], rotation[1], rotation[2],
-                ]
+            # Atomic publish of face tracking offsets
+            self.face_tracking_offsets = interpolated
 
             # If interpolation is complete, start scanning the room
             if t >= 1.0:
                 self.last_face_detected_time = None
                 self.interpolation_start_time = None
-                self.interpolation_start_pose = None
-                self._smoothed_offsets = [0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
+                self._interp_start_offsets = None
+                self._smoothed_offsets.fill(0.0)
                 self._start_scanning()
\ No newline at end of file
@@ -17,6 +17,7 @@ Notes:
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cache
 from importlib import import_module
 from typing import Any, Callable, Optional
 
@@ -34,7 +35,10 @@ class CapabilityReport:
     notes: list[str]
 
 
+@cache
 def _safe_import(module: str):
+    # Cached, including misses, so repeated capability queries never re-enter
+    # the import machinery (optional packages don't appear at runtime).
     try:
         return import_module(module)
     except Exception:
@@ -45,6 +49,7 @@ def _safe_import(module: str):
 # Dances library (Python package) detection
 # ---------------------------------------------------------------------------
 
+@cache
 def _get_dances_available_moves() -> dict[str, Any] | None:
     """Return AVAILABLE_MOVES mapping from reachy_mini_dances_library, if present.
 
@@ -62,25 +67,33 @@ def _get_dances_available_moves() -> dict[str, Any] | None:
     return None
 
 
-def list_dances() -> list[str]:
-    """List dance names from reachy_mini_dances_library if installed."""
+@cache
+def _get_dance_move_class() -> Any | None:
+    """Return the DanceMove class from reachy_mini_dances_library, if present."""
+    mod = _safe_import("reachy_mini_dances_library.dance_move")
+    if mod is None:
+        return None
+    return getattr(mod, "DanceMove", None)
+
+
+@cache
+def _dance_names() -> tuple[str, ...]:
+    # Cached as a tuple so no caller can mutate the shared result
     moves = _get_dances_available_moves()
     if moves is not None:
-        return sorted(moves.keys())
+        return tuple(sorted(moves.keys()))
 
     # Fallback: older layout with callable symbols under reachy_mini_dances_library.dances
     mod = _safe_import("reachy_mini_dances_library.dances")
     if mod is None:
-        return []
+        return ()
+
+    return tuple(sorted(n for n, obj in vars(mod).items() if not n.startswith("_") and callable(obj)))
 
-    names: list[str] = []
-    for name in dir(mod):
-        if name.startswith("_"):
-            continue
-        obj = getattr(mod, name, None)
-        if callable(obj):
-            names.append(name)
-    return sorted(set(names))
+
+def list_dances() -> list[str]:
+    """List dance names from reachy_mini_dances_library if installed."""
+    return list(_dance_names())
 
 
 def get_dance_factory(name: str) -> Optional[Callable[[], Any]]:
@@ -88,12 +101,11 @@ def get_dance_factory(name: str) -> Optional[Callable[[], Any]]:
     moves = _get_dances_available_moves()
     if moves is not None:
         # Preferred API: DanceMove(move_name)
-        dance_move_mod = _safe_import("reachy_mini_dances_library.dance_move")
-        if dance_move_mod is None or not hasattr(dance_move_mod, "DanceMove"):
+        DanceMove = _get_dance_move_class()
+        if DanceMove is None:
             return None
         if name not in moves:
             return None
-        DanceMove = getattr(dance_move_mod, "DanceMove")
 
         def _factory():
             return DanceMove(name)
@@ -121,11 +133,12 @@ def get_dance_factory(name: str) -> Optional[Callable[[], Any]]:
 
 def _http_get_json(url: str):
     try:
-        import json
         import urllib.request
 
+        from reachy_mini_openclaw.jsonutil import json_loads
+
         with urllib.request.urlopen(url, timeout=2.0) as r:
-            return json.loads(r.read().decode("utf-8"))
+            return json_loads(r.read())
     except Exception:
         return None
 
@@ -166,14 +179,9 @@ def play_recorded_move(dataset_name: str, move_name: str) -> bool:
 # Emotions (SDK-native; rare) detection
 # ---------------------------------------------------------------------------
 
-def list_emotions() -> list[str]:
-    """List emotion names, if a Reachy Mini emotion module is installed.
-
-    The Reachy Mini SDK may expose emotions in different ways depending on
-    version. We try a couple of conventional locations.
-
-    If nothing is detected, return an empty list.
-    """
+@cache
+def _emotion_names() -> tuple[str, ...]:
+    # Cached as a tuple so no caller can mutate the shared result
     candidates = [
         "reachy_mini.emotions",  # hypothetical
         "reachy_mini.emotion",  # hypothetical
@@ -183,16 +191,20 @@ def list_emotions() -> list[str]:
         mod = _safe_import(module_name)
         if mod is None:
             continue
-        names: list[str] = []
-        for name in dir(mod):
-            if name.startswith("_"):
-                continue
-            obj = getattr(mod, name, None)
-            if callable(obj):
-                names.append(name)
-        return sorted(set(names))
+        return tuple(sorted(n for n, obj in vars(mod).items() if not n.startswith("_") and callable(obj)))
 
-    return []
+    return ()
+
+
+def list_emotions() -> list[str]:
+    """List emotion names, if a Reachy Mini emotion module is installed.
+
+    The Reachy Mini SDK may expose emotions in different ways depending on
+    version. We try a couple of conventional locations.
+
+    If nothing is detected, return an empty list.
+    """
+    return list(_emotion_names())
 
 
 def capabilities_report(
@@ -0,0 +1,33 @@
+"""JSON helpers that use orjson when it is installed.
+
+orjson is an optional speedup (the ``speedups`` extra); without it these
+fall back to the stdlib ``json`` module with the same results.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError subclasses this, so one except clause covers both
+JSONDecodeError = json.JSONDecodeError
+
+
+def json_loads(data: str | bytes) -> Any:
+    """Parse JSON from str or bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any) -> str:
+    """Serialize to a JSON string (str, so it can go out as WebSocket text)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass  # fall back to stdlib for types orjson doesn't handle
+    return json.dumps(obj)
@@ -18,7 +18,6 @@ Usage:
 
 import os
 import sys
-import time
 import asyncio
 import logging
 import argparse
@@ -312,34 +311,17 @@ class ClawBodyCore:
         Returns:
             Initialized head tracker or None if initialization fails
         """
+        from reachy_mini_openclaw.vision import get_head_tracker
+        
         # Default to YOLO if not specified
         if tracker_type is None:
             tracker_type = "yolo"
         
-        if tracker_type == "yolo":
-            try:
-                from reachy_mini_openclaw.vision.yolo_head_tracker import HeadTracker
-                logger.info("Initializing YOLO face tracker...")
-                tracker = HeadTracker(device="cpu")  # CPU is fast enough for face detection
-                logger.info("YOLO face tracker initialized")
-                return tracker
-            except ImportError as e:
-                logger.warning(f"YOLO tracker not available: {e}")
-                logger.warning("Install with: pip install ultralytics supervision")
-            except Exception as e:
-                logger.error(f"Failed to initialize YOLO tracker: {e}")
-        
-        elif tracker_type == "mediapipe":
-            try:
-                from reachy_mini_openclaw.vision.mediapipe_tracker import HeadTracker
-                logger.info("Initializing MediaPipe face tracker...")
-                tracker = HeadTracker()
-                logger.info("MediaPipe face tracker initialized")
-                return tracker
-            except ImportError as e:
-                logger.warning(f"MediaPipe tracker not available: {e}")
-            except Exception as e:
-                logger.error(f"Failed to initialize MediaPipe tracker: {e}")
+        logger.info(f"Initializing {tracker_type} face tracker...")
+        # CPU is fast enough for face detection
+        tracker = get_head_tracker(tracker_type, device="cpu")
+        if tracker is not None:
+            return tracker
         
         logger.warning("No face tracker available - face tracking disabled")
         return None
@@ -395,7 +377,8 @@ class ClawBodyCore:
         """Run the main application loop."""
         # Test OpenClaw connection
         if self.openclaw_bridge is not None:
-            connected = await self.openclaw_bridge.connect()
+            # Warm up: start the agent-context fetch while the robot gets ready
+            connected = await self.openclaw_bridge.connect(warm_up=True)
             if connected:
                 logger.info("OpenClaw gateway connected")
             else:
@@ -413,7 +396,9 @@ class ClawBodyCore:
                 duration=2.0,
                 body_yaw=0.0,
             )
-            time.sleep(2)  # Wait for goto to complete
+            # Wait for goto to complete; yielding lets the gateway listener
+            # and the agent-context warm-up run meanwhile
+            await asyncio.sleep(2)
             logger.info("Robot at neutral position with motors enabled")
         except Exception as e:
             logger.error("Failed to initialize robot pose: %s", e)
@@ -442,7 +427,7 @@ class ClawBodyCore:
         logger.info("Starting audio...")
         self.robot.media.start_recording()
         self.robot.media.start_playing()
-        time.sleep(1)  # Let pipelines initialize
+        await asyncio.sleep(1)  # Let pipelines initialize
         
         logger.info("Ready! Speak to me...")
         
@@ -487,7 +472,7 @@ class ClawBodyCore:
         if self.openclaw_bridge is not None:
             try:
                 asyncio.get_event_loop().run_until_complete(
-                    self.openclaw_bridge.disconnect()
+                    self.openclaw_bridge.aclose()
                 )
             except Exception as e:
                 logger.debug("OpenClaw disconnect: %s", e)
@@ -12,23 +12,33 @@ Architecture:
 The robot IS the OpenClaw agent - same personality, same memories, same context.
 """
 
-import json
 import base64
 import random
 import asyncio
 import logging
 import os
-from typing import Any, Final, Literal, Optional, Tuple
+import sys
+import time
+from functools import lru_cache
+from math import gcd
+from typing import Any, Awaitable, Callable, Final, Literal, Optional, Tuple
 from datetime import datetime
 
 import numpy as np
 from numpy.typing import NDArray
 from openai import AsyncOpenAI
 from fastrtc import AdditionalOutputs, AsyncStreamHandler, wait_for_item
-from scipy.signal import resample
+from scipy.signal import resample_poly
 from websockets.exceptions import ConnectionClosedError
 
+try:
+    from turbojpeg import TurboJPEG
+    _turbojpeg: Any = TurboJPEG()
+except Exception:  # package or libjpeg-turbo library missing; cv2 is used otherwise
+    _turbojpeg = None
+
 from reachy_mini_openclaw.config import config
+from reachy_mini_openclaw.jsonutil import json_dumps, json_loads
 from reachy_mini_openclaw.prompts import get_session_voice
 from reachy_mini_openclaw.tools.core_tools import ToolDependencies, get_tool_specs, dispatch_tool_call
 
@@ -37,6 +47,18 @@ logger = logging.getLogger(__name__)
 # OpenAI Realtime API audio format
 OPENAI_SAMPLE_RATE: Final[Literal[24000]] = 24000
 
+# Playback audio is coalesced into chunks of at least this many samples (40 ms)
+# before being queued, to cut queue wakeups for small TTS deltas
+AUDIO_BATCH_SAMPLES: Final[int] = int(OPENAI_SAMPLE_RATE * 0.04)
+# TTS deltas are decoded into slabs of this many samples (2 s); queued chunks
+# are views into a slab, so a full slab is retired rather than wrapped
+AUDIO_SLAB_SAMPLES: Final[int] = OPENAI_SAMPLE_RATE * 2
+
+# Camera images sent to OpenClaw are downscaled to fit this size (pixels) and
+# JPEG-encoded at this quality
+JPEG_MAX_DIM: Final[int] = 768
+JPEG_QUALITY: Final[int] = 80
+
 # Base instructions for the robot body capabilities
 
 # Gesture mode
@@ -123,6 +145,51 @@ FALLBACK_IDENTITY = """You are Clawson, the OpenClaw AI assistant. You're a frie
 
 You speak as yourself - not as "an AI assistant" but as Clawson, with your own personality and warmth."""
 
+# OpenClaw query tool (for extended capabilities), built once at import time
+_ASK_OPENCLAW_TOOL_SPEC: Final[dict[str, Any]] = {
+    "type": "function",
+    "name": "ask_openclaw",
+    "description": """Query OpenClaw for information or actions requiring external tools.
+Use this for: weather, calendar, web searches, news, smart home control, 
+accessing conversation memory, or any task needing external data/tools.
+OpenClaw has access to many capabilities you don't have directly.""",
+    "parameters": {
+        "type": "object",
+        "properties": {
+            "query": {
+                "type": "string",
+                "description": "The question or request to send to OpenClaw"
+            },
+            "include_image": {
+                "type": "boolean",
+                "description": "Whether to include current camera image (for 'what do you see' queries)",
+                "default": False
+            }
+        },
+        "required": ["query"]
+    }
+}
+
+
+@lru_cache(maxsize=4)
+def _compose_instructions(agent_context: Optional[str]) -> str:
+    """Combine the agent identity (or the fallback) with the robot body instructions."""
+    return f"""{agent_context or FALLBACK_IDENTITY}
+
+{ROBOT_BODY_INSTRUCTIONS}"""
+
+
+def _drain_queue(q: asyncio.Queue) -> None:
+    """Discard everything in an asyncio.Queue in one step.
+    
+    Clears the underlying deque directly instead of looping over get_nowait(),
+    so barge-in drops stale audio immediately. Task accounting is reset too,
+    so join() does not wait on discarded items.
+    """
+    q._queue.clear()  # type: ignore[attr-defined]
+    q._unfinished_tasks = 0  # type: ignore[attr-defined]
+    q._finished.set()  # type: ignore[attr-defined]
+
 
 class OpenAIRealtimeHandler(AsyncStreamHandler):
     """Handler for OpenAI Realtime API embodying the OpenClaw agent.
@@ -165,6 +232,12 @@ class OpenAIRealtimeHandler(AsyncStreamHandler):
         # Output queue
         self.output_queue: asyncio.Queue[Tuple[int, NDArray[np.int16]] | AdditionalOutputs] = asyncio.Queue()
         
+        # Pending TTS audio not yet flushed to the output queue: the
+        # _audio_batch_samples samples at _slab_off in the current slab
+        self._audio_slab: NDArray[np.int16] = np.empty(AUDIO_SLAB_SAMPLES, dtype=np.int16)
+        self._slab_off = 0
+        self._audio_batch_samples = 0
+        
         # State tracking
         self.last_activity_time = 0.0
         self.start_time = 0.0
@@ -173,53 +246,68 @@ class OpenAIRealtimeHandler(AsyncStreamHandler):
         # OpenClaw agent context (fetched at startup)
         self._agent_context: Optional[str] = None
         
+        # Session setup caches, reused across reconnect attempts
+        self._tools_cache: Optional[list[dict]] = None
+        
         # Conversation tracking for sync
         self._last_user_message: Optional[str] = None
         self._last_assistant_response: Optional[str] = None
         
+        # Polyphase resampling ratios (up, down) keyed by input sample rate
+        self._resample_ratios: dict[int, tuple[int, int]] = {}
+        # Scratch buffers for the float -> int16 conversion, grown on demand
+        self._f32_buf: Optional[NDArray[np.float32]] = None
+        self._i16_buf: Optional[NDArray[np.int16]] = None
+        
+        # OpenCV, imported off the event loop at startup (see _preload_cv2)
+        self._cv2: Any = None
+        
         # Lifecycle flags
         self._shutdown_requested = False
         self._connected_event = asyncio.Event()
         
+        # Realtime event dispatch table (one hashed lookup per event). Dotted
+        # literals are not auto-interned, so intern the keys explicitly.
+        handlers: dict[str, Callable[[Any], Awaitable[None]]] = {
+            "input_audio_buffer.speech_started": self._on_speech_started,
+            "input_audio_buffer.speech_stopped": self._on_speech_stopped,
+            "conversation.item.input_audio_transcription.completed": self._on_input_transcription,
+            "response.created": self._on_response_created,
+            "response.audio.delta": self._on_audio_delta,
+            "response.audio.done": self._on_audio_done,
+            "response.audio_transcript.delta": self._on_audio_transcript_delta,
+            "response.audio_transcript.done": self._on_audio_transcript_done,
+            "response.done": self._on_response_done,
+            "response.function_call_arguments.done": self._handle_tool_call,
+            "error": self._on_error,
+        }
+        self._event_handlers = {sys.intern(k): v for k, v in handlers.items()}
+        
     def copy(self) -> "OpenAIRealtimeHandler":
         """Create a copy of the handler (required by fastrtc)."""
         return OpenAIRealtimeHandler(self.deps, self.openclaw_bridge, self.gradio_mode)
     
     def _build_tools(self) -> list[dict]:
-        """Build the tool list for the session."""
-        tools = []
-        
+        """Build the tool list for the session (cached after the first call)."""
+        if self._tools_cache is not None:
+            return self._tools_cache
+            
         # Robot movement tools (executed locally)
-        for spec in get_tool_specs():
-            tools.append(spec)
+        tools = list(get_tool_specs())
         
         # OpenClaw query tool (for extended capabilities)
         if self.openclaw_bridge is not None:
-            tools.append({
-                "type": "function",
-                "name": "ask_openclaw",
-                "description": """Query OpenClaw for information or actions requiring external tools.
-Use this for: weather, calendar, web searches, news, smart home control, 
-accessing conversation memory, or any task needing external data/tools.
-OpenClaw has access to many capabilities you don't have directly.""",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "query": {
-                            "type": "string",
-                            "description": "The question or request to send to OpenClaw"
-                        },
-                        "include_image": {
-                            "type": "boolean",
-                            "description": "Whether to include current camera image (for 'what do you see' queries)",
-                            "default": False
-                        }
-                    },
-                    "required": ["query"]
-                }
-            })
+            tools.append(_ASK_OPENCLAW_TOOL_SPEC)
         
+        self._tools_cache = tools
         return tools
+    
+    def refresh_context(self) -> None:
+        """Drop cached tools and instructions so the next session rebuilds them."""
+        self._tools_cache = None
+        self._agent_context = None
+        if self.openclaw_bridge is not None:
+            self.openclaw_bridge.invalidate_context()
         
     async def start_up(self) -> None:
         """Start the handler and connect to OpenAI."""
@@ -229,9 +317,14 @@ OpenClaw has access to many capabilities you don't have directly.""",
             raise ValueError("OPENAI_API_KEY required")
             
         self.client = AsyncOpenAI(api_key=api_key)
-        self.start_time = asyncio.get_event_loop().time()
+        self.start_time = time.monotonic()
         self.last_activity_time = self.start_time
         
+        # Warm up cv2 in the background so the first camera query doesn't
+        # block the event loop on the shared-library load
+        if self._cv2 is None:
+            asyncio.get_running_loop().run_in_executor(None, self._preload_cv2)
+        
         max_attempts = 3
         for attempt in range(1, max_attempts + 1):
             try:
@@ -300,146 +393,174 @@ OpenClaw has access to many capabilities you don't have directly.""",
         Returns:
             Complete system instructions combining OpenClaw identity + robot capabilities
         """
-        # Try to fetch context from OpenClaw
-        agent_context = None
-        if self.openclaw_bridge and self.openclaw_bridge.is_connected:
+        # Try to fetch context from OpenClaw (reused on reconnect)
+        agent_context = self._agent_context
+        if agent_context is None and self.openclaw_bridge and self.openclaw_bridge.is_connected:
             logger.info("Fetching agent context from OpenClaw...")
             agent_context = await self.openclaw_bridge.get_agent_context()
             
         if agent_context:
             self._agent_context = agent_context
             logger.info("Using OpenClaw agent context (%d chars)", len(agent_context))
-            # Combine OpenClaw's identity/context with robot body instructions
-            return f"""{agent_context}
-
-{ROBOT_BODY_INSTRUCTIONS}"""
         else:
             logger.warning("Could not fetch OpenClaw context, using fallback identity")
-            return f"""{FALLBACK_IDENTITY}
-
-{ROBOT_BODY_INSTRUCTIONS}"""
+        return _compose_instructions(agent_context or None)
                 
     async def _handle_event(self, event: Any) -> None:
         """Handle an event from the OpenAI Realtime API."""
-        event_type = event.type
-        
-        # Speech detection
-        if event_type == "input_audio_buffer.speech_started":
-            # User started speaking - stop any current output
-            self._speaking = False
-            self.deps.movement_manager.set_processing(False)
-            while not self.output_queue.empty():
-                try:
-                    self.output_queue.get_nowait()
-                except asyncio.QueueEmpty:
-                    break
-            if self.deps.head_wobbler is not None:
-                self.deps.head_wobbler.reset()
-            self.deps.movement_manager.set_listening(True)
-            logger.info("User started speaking")
-            
-        if event_type == "input_audio_buffer.speech_stopped":
-            self.deps.movement_manager.set_listening(False)
-            logger.info("User stopped speaking")
-            
-        # Transcription (for logging, UI, and sync)
-        if event_type == "conversation.item.input_audio_transcription.completed":
-            transcript = event.transcript
-            if transcript and transcript.strip():
-                logger.info("User: %s", transcript)
-                self._last_user_message = transcript  # Track for sync
-                await self.output_queue.put(
-                    AdditionalOutputs({"role": "user", "content": transcript})
-                )
+        handler = self._event_handlers.get(event.type)
+        if handler is not None:
+            await handler(event)
             
-        # Response started - robot is about to speak
-        if event_type == "response.created":
-            self._speaking = True
-            # Reset per-response gesture state
-            self._gesture_buffer = ""
-            self._gesture_fired = {"neg": False, "pos": False, "q": False, "shy": False}
-            self._gesture_last_t = 0.0
-            # Audio/transcript alignment state (best-effort)
-            self._audio_enqueued_s = 0.0
-            self._audio_start_t = None
-            self._transcript_total_chars = 0
-            self._pending_gestures = {}
-            logger.debug("Response started")
-            if GESTURE_MODE == "natural":
-                try:
-                    await self._trigger_turn_gesture(self._last_user_message)
-                except Exception:
-                    pass
-            
-        # Audio output from TTS
-        if event_type == "response.audio.delta":
-            # Audio arriving means we have a response - stop thinking animation
-            self.deps.movement_manager.set_processing(False)
-            
-            # Feed to head wobbler for expressive movement
-            if self.deps.head_wobbler is not None:
-                self.deps.head_wobbler.feed(event.delta)
-            
-            self.last_activity_time = asyncio.get_event_loop().time()
+    # ------------------------------------------------------------------
+    # Realtime event handlers
+    # ------------------------------------------------------------------
+
+    async def _on_speech_started(self, event: Any) -> None:
+        """User started speaking - stop any current output."""
+        self._speaking = False
+        self.deps.movement_manager.set_processing(False)
+        self._audio_batch_samples = 0
+        _drain_queue(self.output_queue)
+        if self.deps.head_wobbler is not None:
+            self.deps.head_wobbler.reset()
+        self.deps.movement_manager.set_listening(True)
+        logger.info("User started speaking")
+        
+    async def _on_speech_stopped(self, event: Any) -> None:
+        """User stopped speaking."""
+        self.deps.movement_manager.set_listening(False)
+        logger.info("User stopped speaking")
+        
+    async def _on_input_transcription(self, event: Any) -> None:
+        """Transcription of user speech (for logging, UI, and sync)."""
+        transcript = event.transcript
+        if transcript and transcript.strip():
+            logger.info("User: %s", transcript)
+            self._last_user_message = transcript  # Track for sync
+            await self.output_queue.put(
+                AdditionalOutputs({"role": "user", "content": transcript})
+            )
             
-            # Queue audio for playback
-            audio_data = np.frombuffer(
-                base64.b64decode(event.delta), 
-                dtype=np.int16
-            ).reshape(1, -1)
-            await self.output_queue.put((OPENAI_SAMPLE_RATE, audio_data))
-            # Track audio playback progress (approx): seconds enqueued since response start
+    async def _on_response_created(self, event: Any) -> None:
+        """Response started - robot is about to speak."""
+        self._speaking = True
+        # Reset per-response gesture state
+        self._gesture_buffer = ""
+        self._gesture_fired = {"neg": False, "pos": False, "q": False, "shy": False}
+        self._gesture_last_t = 0.0
+        # Audio/transcript alignment state (best-effort)
+        self._audio_enqueued_s = 0.0
+        self._audio_start_t = None
+        self._transcript_total_chars = 0
+        self._pending_gestures = {}
+        logger.debug("Response started")
+        if GESTURE_MODE == "natural":
             try:
-                if self._audio_start_t is None:
-                    self._audio_start_t = asyncio.get_event_loop().time()
-                # audio_data is int16 mono (shape 1 x N)
-                self._audio_enqueued_s += float(audio_data.shape[-1]) / float(OPENAI_SAMPLE_RATE)
+                await self._trigger_turn_gesture(self._last_user_message)
             except Exception:
                 pass
-            
-        # Response text (for logging, UI, and live gesture triggers)
-        if event_type == "response.audio_transcript.delta":
-            # Streaming transcript of what's being said (while audio is playing)
-            delta = getattr(event, "transcript", None)
-            if isinstance(delta, str) and delta:
-                await self._on_assistant_transcript_delta(delta)
-            
-        if event_type == "response.audio_transcript.done":
-            response_text = event.transcript
-            logger.info("Assistant: %s", response_text[:100] if len(response_text) > 100 else response_text)
-            self._last_assistant_response = response_text  # Track for sync
-            await self.output_queue.put(
-                AdditionalOutputs({"role": "assistant", "content": response_text})
-            )
-            
-        # Response completed - sync conversation to OpenClaw
-        if event_type == "response.done":
-            self._speaking = False
-            self.deps.movement_manager.set_processing(False)
-            if self.deps.head_wobbler is not None:
-                self.deps.head_wobbler.reset()
-            logger.debug("Response completed")
-            
-            # Sync conversation to OpenClaw for memory continuity
-            await self._sync_to_openclaw()
-            
-        # Tool calls
-        if event_type == "response.function_call_arguments.done":
-            await self._handle_tool_call(event)
-            
-        # Errors
-        if event_type == "error":
-            err = getattr(event, "error", None)
-            msg = getattr(err, "message", str(err))
-            code = getattr(err, "code", "")
-            logger.error("OpenAI error [%s]: %s", code, msg)
-            
+                
+    async def _on_audio_delta(self, event: Any) -> None:
+        """Audio output from TTS."""
+        # Audio arriving means we have a response - stop thinking animation
+        self.deps.movement_manager.set_processing(False)
+        
+        # Feed to head wobbler for expressive movement
+        if self.deps.head_wobbler is not None:
+            self.deps.head_wobbler.feed(event.delta)
+        
+        self.last_activity_time = time.monotonic()
+        
+        # Batch audio for playback; flush once enough has accumulated
+        self._append_audio(np.frombuffer(base64.b64decode(event.delta), dtype=np.int16))
+        if self._audio_batch_samples >= AUDIO_BATCH_SAMPLES:
+            await self._flush_audio_batch()
+            
+    async def _on_audio_done(self, event: Any) -> None:
+        """TTS audio for the response is complete - flush any remainder."""
+        await self._flush_audio_batch()
+        
+    def _append_audio(self, samples: NDArray[np.int16]) -> None:
+        """Copy decoded TTS samples onto the end of the pending batch."""
+        n = samples.shape[0]
+        pending = self._audio_batch_samples
+        start = self._slab_off
+        if start + pending + n > self._audio_slab.shape[0]:
+            # Never wrap: chunks already queued for playback still view this
+            # slab. Start a fresh one and carry the pending samples over.
+            slab = np.empty(max(AUDIO_SLAB_SAMPLES, pending + n), dtype=np.int16)
+            slab[:pending] = self._audio_slab[start:start + pending]
+            self._audio_slab = slab
+            self._slab_off = start = 0
+        end = start + pending + n
+        self._audio_slab[end - n:end] = samples
+        self._audio_batch_samples = pending + n
+        
+    async def _flush_audio_batch(self) -> None:
+        """Queue the pending TTS audio for playback as a single chunk."""
+        n = self._audio_batch_samples
+        if not n:
+            return
+        start = self._slab_off
+        self._slab_off = start + n
+        self._audio_batch_samples = 0
+        
+        # 1 x N view into the slab for playback
+        audio_data = self._audio_slab[np.newaxis, start:start + n]
+        await self.output_queue.put((OPENAI_SAMPLE_RATE, audio_data))
+        # Track audio playback progress (approx): seconds enqueued since response start
+        try:
+            if self._audio_start_t is None:
+                self._audio_start_t = time.monotonic()
+            # audio_data is int16 mono (shape 1 x N)
+            self._audio_enqueued_s += float(audio_data.shape[-1]) / float(OPENAI_SAMPLE_RATE)
+        except Exception:
+            pass
+            
+    async def _on_audio_transcript_delta(self, event: Any) -> None:
+        """Streaming transcript of what's being said (while audio is playing)."""
+        delta = getattr(event, "transcript", None)
+        if isinstance(delta, str) and delta:
+            await self._on_assistant_transcript_delta(delta)
+            
+    async def _on_audio_transcript_done(self, event: Any) -> None:
+        """Final response text (for logging, UI, and sync)."""
+        response_text = event.transcript
+        logger.info("Assistant: %s", response_text[:100] if len(response_text) > 100 else response_text)
+        self._last_assistant_response = response_text  # Track for sync
+        await self.output_queue.put(
+            AdditionalOutputs({"role": "assistant", "content": response_text})
+        )
+        
+    async def _on_response_done(self, event: Any) -> None:
+        """Response completed - sync conversation to OpenClaw."""
+        await self._flush_audio_batch()
+        self._speaking = False
+        self.deps.movement_manager.set_processing(False)
+        if self.deps.head_wobbler is not None:
+            self.deps.head_wobbler.reset()
+        logger.debug("Response completed")
+        
+        # Sync conversation to OpenClaw for memory continuity
+        await self._sync_to_openclaw()
+        
+    async def _on_error(self, event: Any) -> None:
+        """Log an error reported by the Realtime API."""
+        err = getattr(event, "error", None)
+        try:
+            msg, code = err.message, err.code
+        except AttributeError:
+            msg, code = str(err), ""
+        logger.error("OpenAI error [%s]: %s", code, msg)
+        
     async def _handle_tool_call(self, event: Any) -> None:
         """Handle a tool call from OpenAI."""
-        tool_name = getattr(event, "name", None)
-        args_json = getattr(event, "arguments", None)
-        call_id = getattr(event, "call_id", None)
-        
+        try:
+            tool_name, args_json, call_id = event.name, event.arguments, event.call_id
+        except AttributeError:
+            return
+            
         if not isinstance(tool_name, str) or not isinstance(args_json, str):
             return
             
@@ -474,7 +595,7 @@ OpenClaw has access to many capabilities you don't have directly.""",
                 item={
                     "type": "function_call_output",
                     "call_id": call_id,
-                    "output": json.dumps(result),
+                    "output": json_dumps(result),
                 }
             )
             # Trigger response generation after tool result
@@ -497,13 +618,42 @@ OpenClaw has access to many capabilities you don't have directly.""",
             except Exception as e:
                 logger.debug("Failed to sync conversation: %s", e)
     
+    def _preload_cv2(self) -> None:
+        """Import cv2 (runs in an executor thread at startup)."""
+        try:
+            import cv2
+        except ImportError:
+            return
+        self._cv2 = cv2
+        
+    def _encode_jpeg(self, frame: NDArray[np.uint8]) -> bytes:
+        """Downscale a BGR frame to JPEG_MAX_DIM and encode it as JPEG.
+        
+        Uses libjpeg-turbo (PyTurboJPEG) when available, else cv2.imencode.
+        """
+        cv2 = self._cv2
+        if cv2 is None:
+            import cv2
+            
+        h, w = frame.shape[:2]
+        scale = JPEG_MAX_DIM / max(h, w)
+        if scale < 1.0:
+            frame = cv2.resize(
+                frame, (round(w * scale), round(h * scale)), interpolation=cv2.INTER_AREA
+            )
+            
+        if _turbojpeg is not None:
+            return _turbojpeg.encode(np.ascontiguousarray(frame), quality=JPEG_QUALITY)
+        _, buffer = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, JPEG_QUALITY])
+        return buffer.tobytes()
+        
     async def _handle_openclaw_query(self, args_json: str) -> dict:
         """Handle a query to OpenClaw."""
         if self.openclaw_bridge is None or not self.openclaw_bridge.is_connected:
             return {"error": "OpenClaw not connected"}
             
         try:
-            args = json.loads(args_json)
+            args = json_loads(args_json)
             query = args.get("query", "")
             include_image = args.get("include_image", False)
             
@@ -512,9 +662,9 @@ OpenClaw has access to many capabilities you don't have directly.""",
             if include_image and self.deps.camera_worker:
                 frame = self.deps.camera_worker.get_latest_frame()
                 if frame is not None:
-                    import cv2
-                    _, buffer = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, 80])
-                    image_b64 = base64.b64encode(buffer).decode('utf-8')
+                    # Encode in a worker thread to keep audio streaming smooth
+                    jpeg = await asyncio.to_thread(self._encode_jpeg, frame)
+                    image_b64 = base64.b64encode(jpeg).decode('utf-8')
                     logger.debug("Captured camera image for OpenClaw query")
             
             # Query OpenClaw
@@ -601,7 +751,7 @@ OpenClaw has access to many capabilities you don't have directly.""",
         self._transcript_total_chars += len(delta)
 
         # Cooldown to avoid machine-gun gestures
-        now = asyncio.get_event_loop().time()
+        now = time.monotonic()
         if now - float(getattr(self, "_gesture_last_t", 0.0)) < 0.45:
             return
 
@@ -745,37 +895,64 @@ OpenClaw has access to many capabilities you don't have directly.""",
             return
             
         input_sr, audio = frame
+        # int16 samples stay in int16 units through downmix and resampling
+        int16_units = audio.dtype == np.int16
         
-        # Handle stereo
+        # Handle stereo: downmix to mono (the channel axis is the shorter one)
         if audio.ndim == 2:
-            if audio.shape[1] > audio.shape[0]:
-                audio = audio.T
-            if audio.shape[1] > 1:
-                audio = audio[:, 0]
-        
-        audio = audio.flatten()
-        
-        # Convert to float for resampling
-        if audio.dtype == np.int16:
-            audio = audio.astype(np.float32) / 32768.0
-        elif audio.dtype != np.float32:
-            audio = audio.astype(np.float32)
-                
-        # Resample to OpenAI sample rate
-        if input_sr != OPENAI_SAMPLE_RATE:
-            num_samples = int(len(audio) * OPENAI_SAMPLE_RATE / input_sr)
-            audio = resample(audio, num_samples).astype(np.float32)
-            
-        # Convert to int16 for OpenAI
-        audio_int16 = (audio * 32767).astype(np.int16)
+            channel_axis = 0 if audio.shape[0] < audio.shape[1] else 1
+            if audio.shape[channel_axis] > 1:
+                # Single pass that fuses the float32 cast with the channel sum
+                audio = np.mean(audio, axis=channel_axis, dtype=np.float32)
+        
+        if audio.ndim != 1:
+            # (1, N) / (N, 1) mono frames: ravel is a view, unlike flatten
+            audio = audio.ravel()
+        
+        if audio.dtype == np.int16 and input_sr == OPENAI_SAMPLE_RATE:
+            # Already in OpenAI's format -- no conversion pass needed
+            audio_int16 = audio
+        else:
+            if audio.dtype != np.float32 and not int16_units:
+                audio = audio.astype(np.float32)
+            if input_sr != OPENAI_SAMPLE_RATE:
+                # resample_poly takes int16 directly and returns floats
+                audio = self._resample(audio, input_sr)
+            audio_int16 = self._to_int16(audio, 1.0 if int16_units else 32767.0)
         
         # Send to OpenAI
         try:
-            audio_b64 = base64.b64encode(audio_int16.tobytes()).decode("utf-8")
+            audio_b64 = base64.b64encode(audio_int16.tobytes()).decode("ascii")
             await self.connection.input_audio_buffer.append(audio=audio_b64)
         except Exception as e:
             logger.debug("Failed to send audio: %s", e)
             
+    def _resample(self, audio: NDArray, input_sr: int) -> NDArray:
+        """Resample to OpenAI sample rate (polyphase FIR, no per-chunk FFT)."""
+        ratio = self._resample_ratios.get(input_sr)
+        if ratio is None:
+            g = gcd(OPENAI_SAMPLE_RATE, input_sr)
+            ratio = (OPENAI_SAMPLE_RATE // g, input_sr // g)
+            self._resample_ratios[input_sr] = ratio
+        return resample_poly(audio, *ratio)
+        
+    def _to_int16(self, samples: NDArray, gain: float) -> NDArray[np.int16]:
+        """Scale, clip and cast samples to int16 using reusable buffers.
+        
+        The returned array is a view into a scratch buffer that is overwritten
+        by the next call.
+        """
+        n = samples.shape[0]
+        if self._f32_buf is None or self._f32_buf.shape[0] < n:
+            self._f32_buf = np.empty(n, dtype=np.float32)
+            self._i16_buf = np.empty(n, dtype=np.int16)
+        f32 = self._f32_buf[:n]
+        i16 = self._i16_buf[:n]
+        np.multiply(samples, gain, out=f32, casting="unsafe")
+        np.clip(f32, -32768.0, 32767.0, out=f32)
+        np.copyto(i16, f32, casting="unsafe")
+        return i16
+        
     async def emit(self) -> Tuple[int, NDArray[np.int16]] | AdditionalOutputs | None:
         """Get the next output (audio or transcript)."""
         return await wait_for_item(self.output_queue)
@@ -791,8 +968,4 @@ OpenClaw has access to many capabilities you don't have directly.""",
                 logger.debug("Connection close: %s", e)
             self.connection = None
             
-        while not self.output_queue.empty():
-            try:
-                self.output_queue.get_nowait()
-            except asyncio.QueueEmpty:
-                break
+        _drain_queue(self.output_queue)
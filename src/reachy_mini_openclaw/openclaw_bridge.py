@@ -7,22 +7,46 @@ ClawBody uses OpenAI Realtime API for voice I/O (speech recognition + TTS)
 but routes all responses through OpenClaw (Clawson) for intelligence.
 """
 
-import json
 import asyncio
 import logging
+import threading
+import time
 import uuid
+from contextlib import aclosing
 from typing import Optional, Any, AsyncIterator
 from dataclasses import dataclass
 
 import websockets
 
 from reachy_mini_openclaw.config import config
+from reachy_mini_openclaw.jsonutil import JSONDecodeError, json_dumps, json_loads
 
 logger = logging.getLogger(__name__)
 
 # Protocol version supported by this client
 PROTOCOL_VERSION = 3
 
+# Seconds a fetched agent context is reused before asking OpenClaw again
+AGENT_CONTEXT_TTL = 300.0
+
+# Agent runs allowed in flight at once, and chat.send attempts per run.
+# Background syncs get their own, smaller budget so they never take slots
+# from user-facing calls.
+MAX_CONCURRENT_RUNS = 5
+MAX_CONCURRENT_SYNC_RUNS = 2
+SEND_RETRIES = 3
+# Client-side failure codes from _send_request worth retrying
+_RETRYABLE_CODES = frozenset({"TIMEOUT", "ERROR"})
+
+# Background conversation syncs allowed in flight before new ones run inline
+MAX_PENDING_SYNCS = 4
+# Seconds disconnect() waits for in-flight syncs before cancelling them
+SYNC_SHUTDOWN_TIMEOUT = 5.0
+
+
+class OpenClawError(Exception):
+    """The OpenClaw gateway rejected a request."""
+
 
 @dataclass
 class OpenClawResponse:
@@ -38,6 +62,9 @@ class OpenClawBridge:
     This class handles the connect handshake, authentication, and
     chat operations.
 
+    A single WebSocket is opened by connect() and shared by every call
+    until aclose(); the bridge can also be used as an async context manager.
+
     Example:
         bridge = OpenClawBridge()
         await bridge.connect()
@@ -45,6 +72,10 @@ class OpenClawBridge:
         # Simple query
         response = await bridge.chat("Hello!")
         print(response.content)
+
+        # Or, scoped to a block
+        async with OpenClawBridge() as bridge:
+            response = await bridge.chat("Hello!")
     """
 
     def __init__(
@@ -92,6 +123,8 @@ class OpenClawBridge:
             or config.OPENCLAW_SESSION_KEY
             or "main"
         )
+        # Sent with every chat.send, so build it once
+        self._session_key_full = f"agent:{self.agent_id}:{self.session_key}"
 
         # Persistent WebSocket state
         self._ws: Optional[websockets.WebSocketClientProtocol] = None
@@ -103,6 +136,15 @@ class OpenClawBridge:
         self._pending: dict[str, asyncio.Future] = {}
         # Events keyed by runId -> list of event payloads
         self._run_events: dict[str, asyncio.Queue] = {}
+        # Conversation syncs running in the background (see sync_conversation)
+        self._sync_tasks: set[asyncio.Task] = set()
+        self._run_slots = asyncio.Semaphore(MAX_CONCURRENT_RUNS)
+        self._sync_slots = asyncio.Semaphore(MAX_CONCURRENT_SYNC_RUNS)
+        # (fetched_at, context) from the last successful get_agent_context
+        self._ctx_cache: Optional[tuple[float, str]] = None
+        self._ctx_ttl = AGENT_CONTEXT_TTL
+        # Context fetch in progress, shared by concurrent get_agent_context calls
+        self._ctx_task: Optional[asyncio.Task] = None
 
     # ------------------------------------------------------------------
     # URL helpers
@@ -123,9 +165,13 @@ class OpenClawBridge:
     # Connection lifecycle
     # ------------------------------------------------------------------
 
-    async def connect(self) -> bool:
+    async def connect(self, warm_up: bool = False) -> bool:
         """Connect to the OpenClaw gateway and authenticate.
 
+        Args:
+            warm_up: Also start fetching the agent context in the background,
+                     so the first voice session doesn't wait a full agent run
+
         Returns:
             True if connection successful, False otherwise
         """
@@ -145,11 +191,14 @@ class OpenClawBridge:
                 ping_timeout=30,
                 close_timeout=5,
                 origin=origin,
+                # Requests are multiplexed over this one socket by id; frames
+                # (repeated session keys, JSON field names) are deflated
+                compression="deflate",
             )
 
             # 1. Receive challenge
             raw = await asyncio.wait_for(self._ws.recv(), timeout=10)
-            challenge = json.loads(raw)
+            challenge = json_loads(raw)
             if challenge.get("event") != "connect.challenge":
                 logger.warning("Unexpected first frame: %s", challenge.get("event"))
 
@@ -173,11 +222,11 @@ class OpenClawBridge:
                     "scopes": ["chat", "operator.write", "operator.read"],
                 },
             }
-            await self._ws.send(json.dumps(connect_req))
+            await self._ws.send(json_dumps(connect_req))
 
             # 3. Read hello response
             raw = await asyncio.wait_for(self._ws.recv(), timeout=10)
-            hello = json.loads(raw)
+            hello = json_loads(raw)
 
             if hello.get("ok"):
                 self._connected = True
@@ -193,6 +242,8 @@ class OpenClawBridge:
                 self._listener_task = asyncio.create_task(
                     self._listen_loop(), name="openclaw-ws-listener"
                 )
+                if warm_up:
+                    self._start_context_fetch()
                 return True
             else:
                 err = hello.get("error", {})
@@ -214,8 +265,19 @@ class OpenClawBridge:
             return False
 
     async def disconnect(self) -> None:
-        """Disconnect from the gateway."""
+        """Disconnect from the gateway, giving in-flight syncs a moment to finish."""
+        if self._sync_tasks:
+            _, pending = await asyncio.wait(
+                set(self._sync_tasks), timeout=SYNC_SHUTDOWN_TIMEOUT
+            )
+            for task in pending:
+                task.cancel()
+            if pending:
+                logger.debug("Cancelled %d unfinished conversation syncs", len(pending))
+                await asyncio.wait(pending)
         self._connected = False
+        if self._ctx_task is not None and not self._ctx_task.done():
+            self._ctx_task.cancel()
         if self._listener_task and not self._listener_task.done():
             self._listener_task.cancel()
             try:
@@ -224,6 +286,18 @@ class OpenClawBridge:
                 pass
         await self._close_ws()
 
+    async def aclose(self) -> None:
+        """Close the shared gateway connection and release its resources."""
+        await self.disconnect()
+
+    async def __aenter__(self) -> "OpenClawBridge":
+        if not self._connected:
+            await self.connect()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
     async def _close_ws(self) -> None:
         self._connected = False
         if self._ws:
@@ -242,8 +316,8 @@ class OpenClawBridge:
         try:
             async for raw in self._ws:
                 try:
-                    msg = json.loads(raw)
-                except json.JSONDecodeError:
+                    msg = json_loads(raw)
+                except JSONDecodeError:
                     continue
                 await self._dispatch(msg)
         except websockets.ConnectionClosed as e:
@@ -308,7 +382,7 @@ class OpenClawBridge:
         self._pending[req_id] = fut
 
         try:
-            await self._ws.send(json.dumps(req))
+            await self._ws.send(json_dumps(req))
             result = await asyncio.wait_for(fut, timeout=timeout or self.timeout)
             return result
         except asyncio.TimeoutError:
@@ -318,139 +392,186 @@ class OpenClawBridge:
             self._pending.pop(req_id, None)
             return {"ok": False, "error": {"code": "ERROR", "message": str(e)}}
 
+    async def _send_with_retry(
+        self, method: str, params: dict, timeout: Optional[float] = None
+    ) -> dict:
+        """_send_request, retried with backoff on transport failures.
+
+        Only for idempotent requests (chat.send carries an idempotencyKey,
+        so a retried send that did reach the gateway is not run twice).
+        """
+        for attempt in range(SEND_RETRIES):
+            resp = await self._send_request(method, params, timeout=timeout)
+            if resp.get("ok") or attempt == SEND_RETRIES - 1:
+                return resp
+            code = resp.get("error", {}).get("code")
+            if code not in _RETRYABLE_CODES:
+                return resp
+            logger.debug("%s failed (%s), retrying", method, code)
+            await asyncio.sleep(0.25 * 2 ** attempt)
+        return resp
+
     def _full_session_key(self) -> str:
-        """Build the full session key: agent:<agentId>:<sessionKey>."""
-        return f"agent:{self.agent_id}:{self.session_key}"
+        """Full session key: agent:<agentId>:<sessionKey> (precomputed in __init__)."""
+        return self._session_key_full
 
     # ------------------------------------------------------------------
     # Chat API
     # ------------------------------------------------------------------
 
-    async def chat(
+    def _build_message(
         self,
         message: str,
         image_b64: Optional[str] = None,
         system_context: Optional[str] = None,
-    ) -> OpenClawResponse:
-        """Send a message to OpenClaw and get a response.
-
-        OpenClaw maintains conversation memory on its end, so it will be aware
-        of conversations from other channels (WhatsApp, web, etc.). We only send
-        the current message and let OpenClaw handle the context.
-
-        Args:
-            message: The user's message (transcribed speech)
-            image_b64: Optional base64-encoded image from robot camera (not yet
-                       supported over WebSocket chat.send – reserved for future)
-            system_context: Optional additional system context (prepended to message)
+    ) -> str:
+        """Build the chat.send message text from its parts.
 
-        Returns:
-            OpenClawResponse with the AI's response
+        Text-only messages (the common case) are returned as-is; otherwise
+        the prefixes are joined in a single format. The image itself is only
+        flagged: the WebSocket protocol uses string messages, and image
+        passing would require a separate mechanism.
         """
-        if not self._connected:
-            return OpenClawResponse(content="", error="Not connected to OpenClaw")
-
-        # Prefix system context if provided
-        final_message = message
         if system_context:
-            final_message = f"[System: {system_context}]\n\n{message}"
-
-        # If image provided, mention it (WebSocket protocol uses string messages;
-        # image passing would require a separate mechanism)
+            if image_b64:
+                return f"[Image attached]\n[System: {system_context}]\n\n{message}"
+            return f"[System: {system_context}]\n\n{message}"
         if image_b64:
-            final_message = f"[Image attached]\n{final_message}"
+            return f"[Image attached]\n{message}"
+        return message
+
+    async def _iter_run(
+        self, final_message: str, slots: asyncio.Semaphore
+    ) -> AsyncIterator[tuple[str, dict]]:
+        """Send chat.send and yield (event_name, payload) for the resulting run.
 
-        idempotency_key = str(uuid.uuid4())
-        session_key = self._full_session_key()
+        Stops after the run's terminal event (agent lifecycle end or final
+        chat message). Shared by chat(), stream_chat() and syncs; ``slots``
+        is the concurrency budget the run counts against.
 
-        # Create a queue to collect events for this run
-        # We'll get the runId from the response
+        Raises:
+            OpenClawError: The gateway rejected the request
+            asyncio.TimeoutError: No event arrived within self.timeout
+        """
         params = {
-            "idempotencyKey": idempotency_key,
-            "sessionKey": session_key,
+            "idempotencyKey": str(uuid.uuid4()),
+            "sessionKey": self._full_session_key(),
             "message": final_message,
         }
-
-        try:
-            # Send the request
-            resp = await self._send_request("chat.send", params, timeout=30)
+        # Bound concurrent agent runs; the slot is held until the run ends
+        async with slots:
+            resp = await self._send_with_retry("chat.send", params, timeout=30)
 
             if not resp.get("ok"):
                 err = resp.get("error", {})
-                error_msg = f"{err.get('code', 'UNKNOWN')}: {err.get('message', 'Unknown error')}"
-                logger.error("chat.send failed: %s", error_msg)
-                return OpenClawResponse(content="", error=error_msg)
+                raise OpenClawError(
+                    f"{err.get('code', 'UNKNOWN')}: {err.get('message', 'Unknown error')}"
+                )
 
             run_id = resp.get("payload", {}).get("runId")
             if not run_id:
-                return OpenClawResponse(content="", error="No runId in response")
+                raise OpenClawError("No runId in response")
 
             # Register a queue to receive events for this run
             event_queue: asyncio.Queue = asyncio.Queue()
             self._run_events[run_id] = event_queue
 
             try:
-                # Collect the streamed response
-                full_text = ""
                 while True:
                     try:
-                        event = await asyncio.wait_for(
-                            event_queue.get(), timeout=self.timeout
-                        )
-                        payload = event.get("payload", {})
-                        event_name = event.get("event", "")
-
-                        if event_name == "agent":
-                            stream = payload.get("stream")
-                            data = payload.get("data", {})
-
-                            if stream == "assistant":
-                                # Accumulate the full text
-                                full_text = data.get("text", full_text)
-
-                            elif stream == "lifecycle" and data.get("phase") == "end":
-                                # Run completed
-                                break
-
-                        elif event_name == "chat":
-                            state = payload.get("state")
-                            if state == "final":
-                                # Extract final text
-                                msg_payload = payload.get("message", {})
-                                content_parts = msg_payload.get("content", [])
-                                if isinstance(content_parts, list):
-                                    for part in content_parts:
-                                        if isinstance(part, dict) and part.get("type") == "text":
-                                            full_text = part.get("text", full_text)
-                                elif isinstance(content_parts, str):
-                                    full_text = content_parts
-                                break
-
+                        event = await asyncio.wait_for(event_queue.get(), timeout=self.timeout)
                     except asyncio.TimeoutError:
                         logger.warning("Timeout waiting for chat response (runId=%s)", run_id)
-                        if full_text:
-                            break
-                        return OpenClawResponse(content="", error="Response timeout")
-
-                return OpenClawResponse(content=full_text)
-
+                        raise
+                    event_name = event.get("event", "")
+                    payload = event.get("payload", {})
+                    yield event_name, payload
+
+                    if event_name == "agent":
+                        if (
+                            payload.get("stream") == "lifecycle"
+                            and payload.get("data", {}).get("phase") == "end"
+                        ):
+                            return
+                    elif event_name == "chat" and payload.get("state") == "final":
+                        return
             finally:
                 self._run_events.pop(run_id, None)
 
+    async def chat(
+        self,
+        message: str,
+        image_b64: Optional[str] = None,
+        system_context: Optional[str] = None,
+    ) -> OpenClawResponse:
+        """Send a message to OpenClaw and get a response.
+
+        OpenClaw maintains conversation memory on its end, so it will be aware
+        of conversations from other channels (WhatsApp, web, etc.). We only send
+        the current message and let OpenClaw handle the context.
+
+        Args:
+            message: The user's message (transcribed speech)
+            image_b64: Optional base64-encoded image from robot camera (not yet
+                       supported over WebSocket chat.send – reserved for future)
+            system_context: Optional additional system context (prepended to message)
+
+        Returns:
+            OpenClawResponse with the AI's response
+        """
+        if not self._connected:
+            return OpenClawResponse(content="", error="Not connected to OpenClaw")
+
+        final_message = self._build_message(message, image_b64, system_context)
+        return await self._collect_reply(final_message, self._run_slots)
+
+    async def _collect_reply(
+        self, final_message: str, slots: asyncio.Semaphore
+    ) -> OpenClawResponse:
+        """Run one chat.send against ``slots`` and collect the full reply."""
+        full_text = ""
+        try:
+            async with aclosing(self._iter_run(final_message, slots)) as events:
+                async for event_name, payload in events:
+                    if event_name == "agent":
+                        if payload.get("stream") == "assistant":
+                            # Accumulated text so far
+                            full_text = payload.get("data", {}).get("text", full_text)
+
+                    elif event_name == "chat" and payload.get("state") == "final":
+                        # Extract final text
+                        content_parts = payload.get("message", {}).get("content", [])
+                        if isinstance(content_parts, list):
+                            for part in content_parts:
+                                if isinstance(part, dict) and part.get("type") == "text":
+                                    full_text = part.get("text", full_text)
+                        elif isinstance(content_parts, str):
+                            full_text = content_parts
+
+        except asyncio.TimeoutError:
+            if not full_text:
+                return OpenClawResponse(content="", error="Response timeout")
+        except OpenClawError as e:
+            logger.error("chat.send failed: %s", e)
+            return OpenClawResponse(content="", error=str(e))
         except Exception as e:
             logger.error("OpenClaw chat error: %s", e)
             return OpenClawResponse(content="", error=str(e))
 
+        return OpenClawResponse(content=full_text)
+
     async def stream_chat(
         self,
         message: str,
         image_b64: Optional[str] = None,
+        system_context: Optional[str] = None,
     ) -> AsyncIterator[str]:
         """Stream a response from OpenClaw.
 
         Args:
             message: The user's message
             image_b64: Optional base64-encoded image
+            system_context: Optional additional system context (prepended to message)
 
         Yields:
             String chunks of the response as they arrive
@@ -459,63 +580,20 @@ class OpenClawBridge:
             yield "[Error: Not connected to OpenClaw]"
             return
 
-        final_message = message
-        if image_b64:
-            final_message = f"[Image attached]\n{message}"
-
-        params = {
-            "idempotencyKey": str(uuid.uuid4()),
-            "sessionKey": self._full_session_key(),
-            "message": final_message,
-        }
+        final_message = self._build_message(message, image_b64, system_context)
 
         try:
-            resp = await self._send_request("chat.send", params, timeout=30)
-
-            if not resp.get("ok"):
-                err = resp.get("error", {})
-                yield f"[Error: {err.get('message', 'Unknown error')}]"
-                return
-
-            run_id = resp.get("payload", {}).get("runId")
-            if not run_id:
-                yield "[Error: No runId]"
-                return
-
-            event_queue: asyncio.Queue = asyncio.Queue()
-            self._run_events[run_id] = event_queue
-
-            try:
-                prev_text = ""
-                while True:
-                    try:
-                        event = await asyncio.wait_for(
-                            event_queue.get(), timeout=self.timeout
-                        )
-                        payload = event.get("payload", {})
-                        event_name = event.get("event", "")
-
-                        if event_name == "agent":
-                            stream = payload.get("stream")
-                            data = payload.get("data", {})
-
-                            if stream == "assistant":
-                                delta = data.get("delta", "")
-                                if delta:
-                                    yield delta
-
-                            elif stream == "lifecycle" and data.get("phase") == "end":
-                                break
-
-                        elif event_name == "chat" and payload.get("state") == "final":
-                            break
-
-                    except asyncio.TimeoutError:
-                        yield "[Error: timeout]"
-                        break
-            finally:
-                self._run_events.pop(run_id, None)
+            async with aclosing(self._iter_run(final_message, self._run_slots)) as events:
+                async for event_name, payload in events:
+                    if event_name == "agent" and payload.get("stream") == "assistant":
+                        delta = payload.get("data", {}).get("delta", "")
+                        if delta:
+                            yield delta
 
+        except asyncio.TimeoutError:
+            yield "[Error: timeout]"
+        except OpenClawError as e:
+            yield f"[Error: {e}]"
         except Exception as e:
             logger.error("OpenClaw streaming error: %s", e)
             yield f"[Error: {e}]"
@@ -534,9 +612,31 @@ class OpenClawBridge:
         - Important memories about the user
         - Current state
 
+        The result is cached for AGENT_CONTEXT_TTL seconds, since each fetch
+        is a full agent run; call invalidate_context() to force a refresh.
+        Concurrent callers (and a warm-up fetch from connect()) share one run.
+
         Returns:
             A context string to use as system instructions, or None if failed
         """
+        cached = self._ctx_cache
+        if cached is not None and time.monotonic() - cached[0] < self._ctx_ttl:
+            return cached[1]
+
+        task = self._ctx_task
+        if task is None or task.done():
+            task = self._start_context_fetch()
+        return await asyncio.shield(task)
+
+    def _start_context_fetch(self) -> asyncio.Task:
+        """Start a background agent-context fetch."""
+        self._ctx_task = asyncio.create_task(
+            self._fetch_agent_context(), name="openclaw-context"
+        )
+        return self._ctx_task
+
+    async def _fetch_agent_context(self) -> Optional[str]:
+        """Run the agent-context query (see get_agent_context)."""
         try:
             response = await self.chat(
                 message="Provide your current context summary for the robot body.",
@@ -562,6 +662,7 @@ class OpenClawBridge:
                     "Retrieved agent context from OpenClaw (%d chars)",
                     len(response.content),
                 )
+                self._ctx_cache = (time.monotonic(), response.content)
                 return response.content
 
             logger.warning("No context returned from OpenClaw")
@@ -571,17 +672,36 @@ class OpenClawBridge:
             logger.error("Failed to get agent context: %s", e)
             return None
 
+    def invalidate_context(self) -> None:
+        """Drop the cached agent context so the next fetch asks OpenClaw."""
+        self._ctx_cache = None
+
     async def sync_conversation(
         self, user_message: str, assistant_response: str
     ) -> None:
         """Sync a conversation turn back to OpenClaw for memory continuity.
 
+        The sync runs as a background task so the voice loop doesn't wait a
+        gateway round-trip per turn. Once MAX_PENDING_SYNCS are in flight the
+        turn is synced inline instead, which bounds the backlog.
+
         Args:
             user_message: What the user said
             assistant_response: What the robot/AI responded
         """
+        if len(self._sync_tasks) >= MAX_PENDING_SYNCS:
+            await self._do_sync(user_message, assistant_response)
+            return
+        task = asyncio.create_task(
+            self._do_sync(user_message, assistant_response), name="openclaw-sync"
+        )
+        self._sync_tasks.add(task)
+        task.add_done_callback(self._sync_tasks.discard)
+
+    async def _do_sync(self, user_message: str, assistant_response: str) -> None:
+        """Send one conversation turn to OpenClaw (errors are logged, not raised)."""
         try:
-            await self.chat(
+            final_message = self._build_message(
                 message=(
                     f"[ROBOT BODY SYNC] The following happened through the Reachy Mini robot:\n"
                     f"User said: {user_message}\n"
@@ -594,6 +714,8 @@ class OpenClawBridge:
                     "with the user."
                 ),
             )
+            # Counts against the sync budget, not the user-facing one
+            await self._collect_reply(final_message, self._sync_slots)
             logger.debug("Synced conversation to OpenClaw")
         except Exception as e:
             logger.debug("Failed to sync conversation: %s", e)
@@ -601,11 +723,20 @@ class OpenClawBridge:
 
 # Global bridge instance (lazy initialization)
 _bridge: Optional[OpenClawBridge] = None
+_bridge_lock = threading.Lock()
 
 
 def get_bridge() -> OpenClawBridge:
-    """Get the global OpenClaw bridge instance."""
+    """Get the global OpenClaw bridge instance.
+
+    Safe to call from several threads or tasks at startup: exactly one
+    bridge (and so one gateway connection) is ever created.
+    """
     global _bridge
-    if _bridge is None:
-        _bridge = OpenClawBridge()
-    return _bridge
+    bridge = _bridge
+    if bridge is None:
+        with _bridge_lock:
+            if _bridge is None:
+                _bridge = OpenClawBridge()
+            bridge = _bridge
+    return bridge
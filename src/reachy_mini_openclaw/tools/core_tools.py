@@ -8,7 +8,6 @@ Tool Categories:
 2. Vision Tools - Capture and analyze camera images
 """
 
-import json
 import logging
 import base64
 import asyncio
@@ -18,6 +17,8 @@ from typing import Any, Optional, TYPE_CHECKING
 
 import numpy as np
 
+from reachy_mini_openclaw.jsonutil import JSONDecodeError, json_loads
+
 if TYPE_CHECKING:
     from reachy_mini_openclaw.moves import MovementManager, HeadLookMove
     from reachy_mini_openclaw.audio.head_wobbler import HeadWobbler
@@ -208,8 +209,8 @@ async def dispatch_tool_call(
         Dictionary with tool result
     """
     try:
-        args = json.loads(arguments_json) if arguments_json else {}
-    except json.JSONDecodeError:
+        args = json_loads(arguments_json) if arguments_json else {}
+    except JSONDecodeError:
         return {"error": f"Invalid JSON arguments: {arguments_json}"}
     
     handlers = {
@@ -1,70 +1,127 @@
 """Head tracker factory for selecting the best available tracker."""
 
 import logging
-from typing import Any, Optional
+import threading
+from functools import lru_cache, partial
+from typing import Any, Callable, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Process-wide tracker instances keyed by backend ("yolo[:device]" / "mediapipe"), so
+# every consumer shares one loaded model. The lock makes first use thread-safe.
+_tracker_instances: dict[str, Any] = {}
+_tracker_lock = threading.Lock()
 
-def get_head_tracker(tracker_type: Optional[str] = None) -> Optional[Any]:
+
+def get_head_tracker(tracker_type: Optional[str] = None, device: Optional[str] = None) -> Optional[Any]:
     """Get a head tracker instance based on availability and preference.
     
+    Every tracker exposes ``get_head_position(img)`` taking a BGR uint8 frame
+    of any size and returning ``(eye_center, roll)`` with eye_center in
+    normalized [-1, 1] coordinates. Channel order is the tracker's concern:
+    YOLO consumes BGR as-is and MediaPipe swaps to RGB on its (downscaled)
+    input, so callers should not convert frames up front.
+    
     Args:
         tracker_type: One of 'yolo', 'mediapipe', or None for auto-detect
+        device: Torch device for the YOLO tracker (e.g. "cpu"); None keeps
+            the tracker's default. MediaPipe ignores it.
         
+    Trackers are created once per backend (and YOLO device) and shared by
+    later calls.
+    
     Returns:
         Head tracker instance or None if no tracker available
     """
+    yolo_key = "yolo" if device is None else f"yolo:{device}"
+    yolo_factory = partial(_try_yolo_tracker, device)
     if tracker_type == "yolo":
-        return _try_yolo_tracker()
+        return _shared_tracker(yolo_key, yolo_factory)
     elif tracker_type == "mediapipe":
-        return _try_mediapipe_tracker()
+        return _shared_tracker("mediapipe", _try_mediapipe_tracker)
     elif tracker_type is None:
         # Auto-detect: try MediaPipe first (lighter), then YOLO
-        tracker = _try_mediapipe_tracker()
+        tracker = _shared_tracker("mediapipe", _try_mediapipe_tracker)
         if tracker is not None:
             return tracker
-        return _try_yolo_tracker()
+        return _shared_tracker(yolo_key, yolo_factory)
     else:
         logger.warning(f"Unknown tracker type: {tracker_type}")
         return None
 
 
-def _try_yolo_tracker() -> Optional[Any]:
-    """Try to create a YOLO head tracker."""
+def _shared_tracker(backend: str, factory: Callable[[], Optional[Any]]) -> Optional[Any]:
+    """Return the shared tracker for a backend, creating it on first use.
+    
+    Failures are not cached, so a later call can retry.
+    """
+    tracker = _tracker_instances.get(backend)
+    if tracker is not None:
+        return tracker
+    with _tracker_lock:
+        tracker = _tracker_instances.get(backend)
+        if tracker is None:
+            tracker = factory()
+            if tracker is not None:
+                _tracker_instances[backend] = tracker
+        return tracker
+
+
+@lru_cache(maxsize=1)
+def _yolo_tracker_class() -> Optional[type]:
+    """Resolve the YOLO HeadTracker class once (None if unavailable)."""
     try:
         from reachy_mini_openclaw.vision.yolo_head_tracker import HeadTracker
-        tracker = HeadTracker()
-        logger.info("Using YOLO head tracker")
-        return tracker
+        return HeadTracker
     except ImportError as e:
-        logger.debug(f"YOLO tracker not available: {e}")
-        return None
-    except Exception as e:
-        logger.warning(f"Failed to initialize YOLO tracker: {e}")
+        logger.warning(f"YOLO tracker not available: {e}")
+        logger.warning("Install with: pip install ultralytics supervision")
         return None
 
 
-def _try_mediapipe_tracker() -> Optional[Any]:
-    """Try to create a MediaPipe head tracker."""
+@lru_cache(maxsize=1)
+def _mediapipe_tracker_class() -> Optional[Tuple[type, str]]:
+    """Resolve the MediaPipe HeadTracker class and its source once."""
     try:
         # First try the toolbox version
         from reachy_mini_toolbox.vision import HeadTracker
-        tracker = HeadTracker()
-        logger.info("Using MediaPipe head tracker (from toolbox)")
-        return tracker
+        return HeadTracker, "from toolbox"
     except ImportError:
         pass
     
     try:
         # Fall back to our own MediaPipe implementation
         from reachy_mini_openclaw.vision.mediapipe_tracker import HeadTracker
-        tracker = HeadTracker()
-        logger.info("Using MediaPipe head tracker")
-        return tracker
+        return HeadTracker, "built-in"
     except ImportError as e:
-        logger.debug(f"MediaPipe tracker not available: {e}")
+        logger.warning(f"MediaPipe tracker not available: {e}")
+        return None
+
+
+def _try_yolo_tracker(device: Optional[str] = None) -> Optional[Any]:
+    """Try to create a YOLO head tracker."""
+    tracker_cls = _yolo_tracker_class()
+    if tracker_cls is None:
+        return None
+    try:
+        tracker = tracker_cls() if device is None else tracker_cls(device=device)
+        logger.info("Using YOLO head tracker")
+        return tracker
+    except Exception as e:
+        logger.warning(f"Failed to initialize YOLO tracker: {e}")
         return None
+
+
+def _try_mediapipe_tracker() -> Optional[Any]:
+    """Try to create a MediaPipe head tracker."""
+    resolved = _mediapipe_tracker_class()
+    if resolved is None:
+        return None
+    tracker_cls, source = resolved
+    try:
+        tracker = tracker_cls()
+        logger.info(f"Using MediaPipe head tracker ({source})")
+        return tracker
     except Exception as e:
         logger.warning(f"Failed to initialize MediaPipe tracker: {e}")
         return None
@@ -0,0 +1,55 @@
+"""Tests for the camera worker's rotation helpers."""
+
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("scipy")
+pytest.importorskip("reachy_mini")
+
+from scipy.spatial.transform import Rotation as R  # noqa: E402
+
+from reachy_mini_openclaw.camera_worker import _mat_to_euler_xyz  # noqa: E402
+
+# Keep clear of gimbal lock, where the roll/yaw split is not unique
+MAX_PITCH = math.pi / 2 - 1e-2
+
+
+def _random_rotations(n: int = 200) -> "np.ndarray":
+    matrices = R.random(n, np.random.default_rng(1234)).as_matrix()
+    pitch = R.from_matrix(matrices).as_euler("xyz")[:, 1]
+    return matrices[np.abs(pitch) < MAX_PITCH]
+
+
+def _implementations():
+    """The function as called at runtime, plus its pure-Python body under numba."""
+    impls = [_mat_to_euler_xyz]
+    py_func = getattr(_mat_to_euler_xyz, "py_func", None)
+    if py_func is not None:
+        impls.append(py_func)
+    return impls
+
+
+@pytest.mark.parametrize("func", _implementations())
+def test_matches_scipy_on_random_rotations(func):
+    for m in _random_rotations():
+        expected = R.from_matrix(m).as_euler("xyz")
+        np.testing.assert_allclose(func(m), expected, atol=1e-9)
+
+
+@pytest.mark.parametrize("func", _implementations())
+def test_matches_scipy_on_float32_pose_slice(func):
+    # camera_worker passes target_pose[:3, :3]: a non-contiguous view of a 4x4 pose
+    for m in _random_rotations():
+        pose = np.eye(4, dtype=np.float32)
+        pose[:3, :3] = m
+        view = pose[:3, :3]
+        assert not view.flags.c_contiguous
+        expected = R.from_matrix(view.astype(np.float64)).as_euler("xyz")
+        np.testing.assert_allclose(func(view), expected, atol=1e-4)
+
+
+@pytest.mark.parametrize("func", _implementations())
+def test_identity_is_zero(func):
+    assert func(np.eye(3)) == pytest.approx((0.0, 0.0, 0.0))